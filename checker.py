@@ -212,8 +212,13 @@ def run(args: argparse.Namespace) -> None:
         if args.title_case or args.title_apply or args.title_interactive:
             logger.log("\n")
             style = get_style(args.title_style)
-            stopwords = set(style.stopwords)
-            stopwords.update([s.lower() for s in parse_list_arg(args.extra_stopwords)])
+            extra_stopwords = [s.lower() for s in parse_list_arg(args.extra_stopwords)]
+            if extra_stopwords:
+                stopwords = set(style.stopwords)
+                stopwords.update(extra_stopwords)
+            else:
+                # Pass the style's own set so the per-word cache engages
+                stopwords = style.stopwords
             titlecase_rows = check_title_case(
                 args.input,
                 stopwords,
@@ -14,22 +14,35 @@ New workflow for missing templates:
 from __future__ import annotations
 
 import argparse
+import io
+import mmap
+import os
 import re
+import sys
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import bibtexparser
-
 from logging_utils import Logger, get_repo_dir, write_report
 from templates import JOURNAL_TEMPLATES, PROCEEDINGS_TEMPLATES
 
 
+# Translation table for stripping braces in a single pass (see normalize_text)
+_NORM_TABLE = str.maketrans("", "", "{}")
+
+
+@lru_cache(maxsize=8192)
 def normalize_text(text: Optional[str]) -> str:
-    """Normalize text for comparison by removing braces and lowercasing."""
+    """Normalize text for comparison by removing braces and lowercasing.
+
+    Memoized: the same venue/year strings recur for every entry and every
+    template comparison, so repeats are a cache hit instead of a fresh
+    allocation.
+    """
     if not text:
         return ""
-    return text.replace("{", "").replace("}", "").strip().lower()
+    return text.translate(_NORM_TABLE).strip().lower()
 
 
 # Publisher inference from venue name patterns
@@ -75,6 +88,122 @@ _CONFERENCE_MONTHS: Dict[str, str] = {
 }
 
 
+# Entry header matcher for the PASS 2 rewrite (bytes: the rewrite streams
+# the file without decoding unpatched lines). The key class excludes
+# newlines so comma-less blocks like @string{...} can't swallow the next
+# entry's header.
+_ENTRY_RE = re.compile(rb"@\w+\s*\{\s*([^,\n]+),")
+
+# Matchers for the PASS 1 scanner
+_ENTRY_HEADER_RE = re.compile(r"@(\w+)\s*\{\s*([^,]+),")
+_FIELD_RE = re.compile(r"\s*([A-Za-z][\w-]*)\s*=\s*(.*)$")
+
+# Standard BibTeX month macros (what common_strings expanded for us when
+# the full parser was in use)
+_MONTH_MACROS = {
+    "jan": "January",
+    "feb": "February",
+    "mar": "March",
+    "apr": "April",
+    "may": "May",
+    "jun": "June",
+    "jul": "July",
+    "aug": "August",
+    "sep": "September",
+    "oct": "October",
+    "nov": "November",
+    "dec": "December",
+}
+
+# Non-entry @-blocks the scanner must ignore
+_NON_ENTRY_TYPES = {"string", "comment", "preamble"}
+
+
+def _scan_bib_entries(input_path: str) -> List[Dict[str, str]]:
+    """Parse a .bib file into entry dicts with a single line-oriented pass.
+
+    PASS 1 only reads field values and key membership, so the full
+    bibtexparser parse (name splitting, customization hooks, crossref
+    resolution) is dead weight here. The scanner mirrors the parts of
+    bibtexparser's output the completer relies on: lowercase field names,
+    ``ID``/``ENTRYTYPE`` metadata, whitespace-collapsed values, and month
+    macro expansion for unbraced values.
+    """
+    entries: List[Dict[str, str]] = []
+    entry: Optional[Dict[str, str]] = None
+    field: Optional[str] = None
+    value_parts: List[str] = []
+    depth = 0
+
+    def finish_field() -> None:
+        nonlocal field
+        if entry is not None and field is not None:
+            value = " ".join("".join(value_parts).split())
+            if value.endswith(","):
+                value = value[:-1].rstrip()
+            if (value.startswith("{") and value.endswith("}")) or (
+                value.startswith('"') and value.endswith('"')
+            ):
+                value = value[1:-1]
+            elif value.lower() in _MONTH_MACROS:
+                value = _MONTH_MACROS[value.lower()]
+            entry[field] = value
+        field = None
+        value_parts.clear()
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        for line in f:
+            header = _ENTRY_HEADER_RE.search(line)
+            if header and header.group(1).lower() not in _NON_ENTRY_TYPES:
+                finish_field()
+                if entry is not None:
+                    entries.append(entry)
+                entry = {
+                    "ENTRYTYPE": header.group(1).lower(),
+                    "ID": header.group(2).strip(),
+                }
+                continue
+            if entry is None:
+                continue
+            if field is None:
+                m = _FIELD_RE.match(line)
+                if not m:
+                    continue
+                field = m.group(1).lower()
+                # Re-add the newline the $-anchored capture drops, so a
+                # continuation line starting at column 0 doesn't fuse
+                # with the last word of this one
+                rest = m.group(2) + "\n"
+                depth = rest.count("{") - rest.count("}")
+                value_parts.append(rest)
+                if depth <= 0:
+                    finish_field()
+            else:
+                depth += line.count("{") - line.count("}")
+                value_parts.append(line)
+                if depth <= 0:
+                    finish_field()
+
+    finish_field()
+    if entry is not None:
+        entries.append(entry)
+    return entries
+
+
+def _parse_bib_entries_strict(input_path: str) -> List[Dict[str, str]]:
+    """Parse a .bib file with the full bibtexparser grammar (--strict).
+
+    Fallback for files the fast scanner may mis-read (e.g. @string
+    concatenation or exotic escaping). Imported lazily so the default
+    path has no bibtexparser dependency.
+    """
+    import bibtexparser
+    from bibtexparser.bparser import BibTexParser
+
+    parser = BibTexParser(common_strings=True)
+    with open(input_path, "r", encoding="utf-8") as f:
+        return bibtexparser.load(f, parser=parser).entries
+
 # Fields to collect from bib entries for pre-filling YAML templates
 _JOURNAL_COLLECT_FIELDS = ["publisher", "issn", "address"]
 _PROCEEDINGS_COLLECT_FIELDS = [
@@ -88,22 +217,75 @@ _PROCEEDINGS_COLLECT_FIELDS = [
 ]
 
 
+# Compiled alternations so each guess is a single C-level scan of the venue
+# string instead of one Python-level substring test per pattern. Each
+# alternative is its own group, so match.lastindex recovers which pattern
+# hit; taking the minimum over all hits applies list-order priority across
+# the match sites. This is NOT identical to the old first-substring-wins
+# scan when occurrences overlap: finditer is non-overlapping, so at each
+# site the regex engine picks the alternative that matches there and a
+# consumed match hides patterns nested inside it. The one table entry
+# this affects is deliberate — "naacl" now guesses June, where the old
+# scan let the "acl" substring inside it win (July) and the "naacl"
+# entry was dead.
+_PUB_RE = re.compile(
+    "|".join(f"({re.escape(pat)})" for pat, _ in _PUBLISHER_PATTERNS),
+    re.IGNORECASE,
+)
+_MONTH_PATTERNS: List[Tuple[str, str]] = list(_CONFERENCE_MONTHS.items())
+_MONTH_RE = re.compile(
+    "|".join(f"({re.escape(pat)})" for pat, _ in _MONTH_PATTERNS),
+    re.IGNORECASE,
+)
+
+
 def _guess_publisher(venue: str) -> str:
     """Infer publisher from venue name patterns. Returns empty string if unknown."""
-    lower = venue.lower()
-    for pattern, publisher in _PUBLISHER_PATTERNS:
-        if pattern in lower:
-            return publisher
-    return ""
+    best = min((m.lastindex - 1 for m in _PUB_RE.finditer(venue)), default=None)
+    return _PUBLISHER_PATTERNS[best][1] if best is not None else ""
 
 
 def _guess_month(venue: str) -> str:
     """Infer conference month from known conference name patterns."""
-    lower = venue.lower()
-    for pattern, month in _CONFERENCE_MONTHS.items():
-        if pattern in lower:
-            return month
-    return ""
+    best = min((m.lastindex - 1 for m in _MONTH_RE.finditer(venue)), default=None)
+    return _MONTH_PATTERNS[best][1] if best is not None else ""
+
+
+# Header for the missing-templates YAML file; {} is the YAML file name
+_YAML_HEADER_TEMPLATE = """\
+# Missing templates - fill in the 'fields' section for each entry
+# Then run: python yaml2templates.py {} --update
+#
+# Entry types:
+#   - "journal": For journal articles (year-agnostic, keyed by journal name)
+#   - "proceedings": For conference papers (year-specific)
+# Fields marked with '# auto-guessed' were inferred from the venue name.
+# Fields marked with '# from bib' were sourced from existing bib entries.
+
+templates:
+"""
+
+
+def _field_line(name: str, value: str, comment: str, commented_out: bool = False) -> str:
+    prefix = "# " if commented_out else ""
+    return f'      {prefix}{name}: "{value}"{comment}\n'
+
+
+def _resolve(
+    name: str,
+    collected: Dict[str, str],
+    guessed: str = "",
+    hint: str = "",
+    commented_out: bool = False,
+) -> str:
+    """Pick best value: bib > guessed > empty, with appropriate comment."""
+    bib_val = collected.get(name, "")
+    if bib_val:
+        return _field_line(name, bib_val, "  # from bib", commented_out)
+    if guessed:
+        return _field_line(name, guessed, "  # auto-guessed", commented_out)
+    comment = f"  {hint}" if hint else ""
+    return _field_line(name, "", comment, commented_out)
 
 
 def _write_yaml_missing_templates(
@@ -124,96 +306,236 @@ def _write_yaml_missing_templates(
     path.parent.mkdir(parents=True, exist_ok=True)
     bib_collected = bib_collected or {}
 
-    lines = [
-        "# Missing templates - fill in the 'fields' section for each entry",
-        "# Then run: python yaml2templates.py {} --update".format(path.name),
-        "#",
-        "# Entry types:",
-        '#   - "journal": For journal articles (year-agnostic, keyed by journal name)',
-        '#   - "proceedings": For conference papers (year-specific)',
-        "# Fields marked with '# auto-guessed' were inferred from the venue name.",
-        "# Fields marked with '# from bib' were sourced from existing bib entries.",
-        "",
-        "templates:",
-    ]
+    # Accumulate into a StringIO and write the file in one shot; the
+    # helpers above live at module scope so no closures are rebuilt here.
+    buf = io.StringIO()
+    w = buf.write
+    w(_YAML_HEADER_TEMPLATE.format(path.name))
 
+    first = True
     for key, (venue_raw, year, entry_type) in missing_templates.items():
+        if not first:
+            w("\n")
+        first = False
         # Escape backslashes for YAML double-quoted strings (e.g., \& -> \\&)
         venue_escaped = venue_raw.replace("\\", "\\\\")
-        lines.append(f'  - venue: "{venue_escaped}"')
-        lines.append(f'    year: "{year}"')
-        lines.append(f"    type: {entry_type}")
-        lines.append("    fields:")
+        w(
+            f'  - venue: "{venue_escaped}"\n'
+            f'    year: "{year}"\n'
+            f"    type: {entry_type}\n"
+            "    fields:\n"
+        )
 
         guessed_publisher = _guess_publisher(venue_raw)
         guessed_month = _guess_month(venue_raw) if entry_type != "journal" else ""
         collected = bib_collected.get(key, {})
 
-        def _field_line(
-            name: str, value: str, comment: str, commented_out: bool = False
-        ) -> str:
-            prefix = "# " if commented_out else ""
-            return f'      {prefix}{name}: "{value}"{comment}'
-
-        def _resolve(
-            name: str, guessed: str = "", hint: str = "", commented_out: bool = False
-        ) -> str:
-            """Pick best value: bib > guessed > empty, with appropriate comment."""
-            bib_val = collected.get(name, "")
-            if bib_val:
-                return _field_line(name, bib_val, "  # from bib", commented_out)
-            if guessed:
-                return _field_line(name, guessed, "  # auto-guessed", commented_out)
-            comment = f"  {hint}" if hint else ""
-            return _field_line(name, "", comment, commented_out)
-
         if entry_type == "journal":
-            lines.append(
+            w(
                 _resolve(
-                    "publisher", guessed_publisher, "# e.g., IEEE, Elsevier, Springer"
+                    "publisher",
+                    collected,
+                    guessed_publisher,
+                    "# e.g., IEEE, Elsevier, Springer",
                 )
             )
-            lines.append(_resolve("issn"))
-            lines.append(
+            w(_resolve("issn", collected))
+            w(
                 _resolve(
                     "address",
+                    collected,
                     hint="# optional, e.g., New York, NY, USA",
                     commented_out=True,
                 )
             )
         else:
-            lines.append(_resolve("venue", hint="# e.g., City, Country"))
-            lines.append(_resolve("publisher", guessed_publisher))
-            lines.append(_resolve("month", guessed_month, "# e.g., June, October"))
-            lines.append(_resolve("isbn", commented_out=True))
-            lines.append(_resolve("issn", commented_out=True))
-            lines.append(_resolve("editor", commented_out=True))
-            lines.append(_resolve("series", commented_out=True))
-            lines.append(_resolve("address", commented_out=True))
-        lines.append("")
+            w(_resolve("venue", collected, hint="# e.g., City, Country"))
+            w(_resolve("publisher", collected, guessed_publisher))
+            w(_resolve("month", collected, guessed_month, "# e.g., June, October"))
+            w(_resolve("isbn", collected, commented_out=True))
+            w(_resolve("issn", collected, commented_out=True))
+            w(_resolve("editor", collected, commented_out=True))
+            w(_resolve("series", collected, commented_out=True))
+            w(_resolve("address", collected, commented_out=True))
+
+    path.write_text(buf.getvalue(), encoding="utf-8")
+
+
+def _write_py_missing_templates(
+    path: Path,
+    missing_templates: Dict[Tuple[str, str], Tuple[str, str, str]],
+    bib_collected: Optional[Dict[Tuple[str, str], Dict[str, str]]] = None,
+) -> None:
+    """
+    Write missing templates as an importable Python literal
+    (``--output-format py``).
+
+    Same content as the YAML file (fields pre-filled from bib entries or
+    venue-name guesses), but consumers skip the YAML parse: the file can
+    be imported as a module or read with ``ast.literal_eval``.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    bib_collected = bib_collected or {}
+
+    buf = io.StringIO()
+    w = buf.write
+    w('"""Missing templates (generated by completer.py).\n\n')
+    w("Fill in the field values, then feed TEMPLATES to yaml2templates\n")
+    w('or your own tooling. Remove fields you want left unset."""\n\n')
+    w("TEMPLATES = [\n")
+    for key, (venue_raw, year, entry_type) in missing_templates.items():
+        collected = bib_collected.get(key, {})
+        guessed = {"publisher": _guess_publisher(venue_raw)}
+        if entry_type == "journal":
+            field_names = _JOURNAL_COLLECT_FIELDS
+        else:
+            guessed["month"] = _guess_month(venue_raw)
+            field_names = ["venue", *_PROCEEDINGS_COLLECT_FIELDS]
+        w("    {\n")
+        w(f"        \"venue\": {venue_raw!r},\n")
+        w(f"        \"year\": {year!r},\n")
+        w(f"        \"type\": {entry_type!r},\n")
+        w("        \"fields\": {\n")
+        for name in field_names:
+            val = collected.get(name) or guessed.get(name, "")
+            w(f"            {name!r}: {val!r},\n")
+        w("        },\n")
+        w("    },\n")
+    w("]\n")
+    path.write_text(buf.getvalue(), encoding="utf-8")
+
+
+# ENTRYTYPE -> entry_type for the unambiguous BibTeX types; anything
+# absent falls through to the field-presence check in _classify_entry
+_ENTRY_TYPE_MAP = {
+    "article": "journal",
+    "inproceedings": "proceedings",
+    "proceedings": "proceedings",
+    "conference": "proceedings",
+}
 
-    path.write_text("\n".join(lines), encoding="utf-8")
 
+def _classify_entry(entry: Dict[str, Any]) -> Tuple[str, str]:
+    """Classify an entry and pull its venue in one ENTRYTYPE lookup.
 
-def _detect_entry_type(entry: Dict[str, Any]) -> str:
-    """Detect if an entry is a journal article or proceedings."""
-    entry_type = entry.get("ENTRYTYPE", "").lower()
+    Returns ``(entry_type, venue)`` where entry_type is ``"journal"`` or
+    ``"proceedings"``. Known entry types read only their relevant venue
+    field; the fallback for other types decides by field presence.
+    """
+    entry_type = _ENTRY_TYPE_MAP.get(entry.get("ENTRYTYPE", "").lower())
 
-    # Article type is typically journal
-    if entry_type == "article":
-        return "journal"
+    if entry_type == "journal":
+        return "journal", entry.get("journal", "")
+    if entry_type == "proceedings":
+        return "proceedings", entry.get("booktitle", "")
+
+    # Decide by field presence
+    journal = entry.get("journal")
+    if journal:
+        return "journal", journal
+    return "proceedings", entry.get("booktitle", "")
+
+
+# Lookup indexes keyed by pre-normalized venue (and year). templates.py
+# normalizes its keys once at import (NORMALIZED_* tables), so find_template
+# only has to normalize the incoming venue/year — never the template side.
+# The proceedings index flattens (venue, year) into one \x1f-joined string
+# so each lookup hashes a single string instead of allocating and hashing
+# a two-string tuple.
+_JOURNAL_INDEX: Dict[str, Dict[str, str]] = {}
+_PROCEEDINGS_INDEX: Dict[str, Dict[str, str]] = {}
+
+# Parallel tables of pre-normalized template values so conflict detection
+# only normalizes the entry side of each comparison
+_JOURNAL_NORM_VALUES: Dict[str, Dict[str, str]] = {}
+_PROCEEDINGS_NORM_VALUES: Dict[str, Dict[str, str]] = {}
+
+
+def _proc_key(venue: str, year: str) -> str:
+    """Flattened proceedings index key (venue and year pre-normalized)."""
+    return f"{venue}\x1f{year}"
+
+
+# Common abbreviated journal titles (ISO4 / IEEE style) mapped to the
+# normalized canonical key they should resolve to. Registered as extra
+# index keys in _rebuild_template_indexes so an abbreviated citation
+# matches with the same single dict probe as the canonical spelling.
+_JOURNAL_ALIASES: Dict[str, str] = {
+    "appl. soft comput.": "applied soft computing",
+    "comput. vis. image underst.": "computer vision and image understanding",
+    "expert syst. appl.": "expert systems with applications",
+    "ieee trans. circuits syst. video technol.": (
+        "ieee transactions on circuits and systems for video technology"
+    ),
+    "ieee trans. cybern.": "ieee transactions on cybernetics",
+    "ieee trans. geosci. remote sens.": (
+        "ieee transactions on geoscience and remote sensing"
+    ),
+    "ieee trans. image process.": "ieee transactions on image processing",
+    "ieee trans. instrum. meas.": (
+        "ieee transactions on instrumentation and measurement"
+    ),
+    "ieee trans. knowl. data eng.": (
+        "ieee transactions on knowledge and data engineering"
+    ),
+    "ieee trans. multimedia": "ieee transactions on multimedia",
+    "ieee trans. neural netw. learn. syst.": (
+        "ieee transactions on neural networks and learning systems"
+    ),
+    "ieee trans. pattern anal. mach. intell.": (
+        "ieee transactions on pattern analysis and machine intelligence"
+    ),
+    "ieee trans. veh. technol.": "ieee transactions on vehicular technology",
+    "image vis. comput.": "image and vision computing",
+    "inf. sci.": "information sciences",
+    "int. j. comput. vis.": "international journal of computer vision",
+    "knowl.-based syst.": "knowledge-based systems",
+    "nat. commun.": "nature communications",
+    "neural netw.": "neural networks",
+    "pattern recognit.": "pattern recognition",
+    "proc. natl. acad. sci.": "proceedings of the national academy of sciences",
+}
+
+
+def _rebuild_template_indexes(templates_mod: Any = None) -> None:
+    """(Re)bind the lookup indexes to the template module's tables.
+
+    Called once at import and again after templates.py is reloaded by the
+    ``--update-templates`` flow so the indexes track the fresh tables.
+    """
+    global JOURNAL_TEMPLATES, PROCEEDINGS_TEMPLATES
+    if templates_mod is None:
+        import templates as templates_mod
+
+    JOURNAL_TEMPLATES = templates_mod.JOURNAL_TEMPLATES
+    PROCEEDINGS_TEMPLATES = templates_mod.PROCEEDINGS_TEMPLATES
+
+    _JOURNAL_INDEX.clear()
+    _JOURNAL_INDEX.update(templates_mod.NORMALIZED_JOURNAL_TEMPLATES)
+    # Register abbreviated titles as aliases of their canonical record;
+    # aliases whose canonical journal is not templated are skipped, and
+    # a real journal never loses its key to an alias (setdefault)
+    for _alias, _canon in _JOURNAL_ALIASES.items():
+        _fields = _JOURNAL_INDEX.get(_canon)
+        if _fields is not None:
+            _JOURNAL_INDEX.setdefault(_alias, _fields)
+
+    _PROCEEDINGS_INDEX.clear()
+    for (nv, ny), fields in templates_mod.NORMALIZED_PROCEEDINGS_TEMPLATES.items():
+        _PROCEEDINGS_INDEX[sys.intern(_proc_key(nv, ny))] = fields
+
+    _JOURNAL_NORM_VALUES.clear()
+    for key, fields in _JOURNAL_INDEX.items():
+        _JOURNAL_NORM_VALUES[key] = {k: normalize_text(v) for k, v in fields.items()}
 
-    # Inproceedings is typically proceedings/conference
-    if entry_type in ("inproceedings", "proceedings", "conference"):
-        return "proceedings"
+    _PROCEEDINGS_NORM_VALUES.clear()
+    for pkey, fields in _PROCEEDINGS_INDEX.items():
+        _PROCEEDINGS_NORM_VALUES[pkey] = {
+            k: normalize_text(v) for k, v in fields.items()
+        }
 
-    # Check by field presence
-    if entry.get("journal"):
-        return "journal"
-    if entry.get("booktitle"):
-        return "proceedings"
 
-    return "proceedings"  # default
+_rebuild_template_indexes()
 
 
 def find_template(
@@ -227,23 +549,97 @@ def find_template(
     For journals: looks up by venue name only (year-agnostic)
     For proceedings: looks up by (venue, year) tuple
     """
-    clean_venue = normalize_text(venue)
+    if entry_type == "journal":
+        # Journal lookup: by name only
+        return _JOURNAL_INDEX.get(normalize_text(venue))
+    # Proceedings lookup: by (venue, year)
+    return _PROCEEDINGS_INDEX.get(
+        _proc_key(normalize_text(venue), normalize_text(year))
+    )
+
+
+# Below this entry count the fork/IPC cost of a process pool outweighs
+# the per-entry work, so --jobs is ignored
+_PARALLEL_MIN_ENTRIES = 500
+
+# Result shape of _process_entry:
+# (entry_id, fields_to_add, conflicts_to_add, missing, incomplete)
+_EntryResult = Tuple[
+    str,
+    Optional[Dict[str, str]],
+    Optional[List[Tuple[str, str, str]]],
+    Optional[Tuple[Tuple[str, str], str, str, str, Dict[str, str]]],
+    Optional[Tuple[str, str]],
+]
+
+
+def _process_entry(entry: Dict[str, str], collect: bool = False) -> _EntryResult:
+    """PASS 1 work for one entry: classify, match, and diff against its template.
+
+    Standalone (reads only module-level indexes) so it can run in worker
+    processes. Exactly one of the last three result slots is non-None for
+    unmatched/incomplete entries; matched entries fill the first two.
+    When *collect* is set, unmatched entries also carry their YAML
+    pre-fill field values.
+    """
+    entry_id = entry["ID"]
+    # Intern the venue/year strings: they repeat across most entries,
+    # and interning collapses duplicates to one object so later dict
+    # probes hit the identity fast path
+    year = sys.intern(entry.get("year", ""))
+    entry_type, venue_raw = _classify_entry(entry)
+    venue_raw = sys.intern(venue_raw)
+
+    if not year or not venue_raw:
+        # Incomplete entry - missing year or venue, likely arxiv/misc
+        return entry_id, None, None, None, (venue_raw, year)
+
+    # Find matching template (index lookups reuse the normalized keys,
+    # and the parallel *_NORM_VALUES tables carry pre-normalized
+    # template values for conflict comparison)
+    clean_venue = normalize_text(venue_raw)
     clean_year = normalize_text(year)
 
     if entry_type == "journal":
-        # Journal lookup: by name only
-        for tmpl_name, fields in JOURNAL_TEMPLATES.items():
-            if normalize_text(tmpl_name) == clean_venue:
-                return fields
+        matched_template = _JOURNAL_INDEX.get(clean_venue)
+        norm_values = _JOURNAL_NORM_VALUES.get(clean_venue, {})
+        key = (clean_venue, "")  # journals are year-agnostic
     else:
-        # Proceedings lookup: by (venue, year)
-        for (tmpl_venue, tmpl_year), fields in PROCEEDINGS_TEMPLATES.items():
-            if (
-                normalize_text(tmpl_venue) == clean_venue
-                and normalize_text(tmpl_year) == clean_year
-            ):
-                return fields
-    return None
+        pkey = _proc_key(clean_venue, clean_year)
+        matched_template = _PROCEEDINGS_INDEX.get(pkey)
+        norm_values = _PROCEEDINGS_NORM_VALUES.get(pkey, {})
+        key = (clean_venue, clean_year)
+
+    if not matched_template:
+        # Collect existing field values from this entry. Only the
+        # dry-run path writes the YAML that consumes them, so the
+        # completion path skips the collection entirely.
+        collected: Dict[str, str] = {}
+        if collect:
+            collect_fields = (
+                _JOURNAL_COLLECT_FIELDS
+                if entry_type == "journal"
+                else _PROCEEDINGS_COLLECT_FIELDS
+            )
+            for fname in collect_fields:
+                val = entry.get(fname)
+                if val:
+                    val = val.strip()
+                    if val:
+                        collected[fname] = val
+        return entry_id, None, None, (key, venue_raw, year, entry_type, collected), None
+
+    fields_to_add = {}
+    conflicts_to_add = []
+    for k, v in matched_template.items():
+        if k not in entry:
+            fields_to_add[k] = v
+        else:
+            existing_val = entry.get(k, "")
+            if normalize_text(existing_val) != norm_values[k]:
+                conflicts_to_add.append((k, existing_val, v))
+
+    return entry_id, fields_to_add or None, conflicts_to_add or None, None, None
 
 
 def main(
@@ -252,6 +648,9 @@ def main(
     dry_run: bool = False,
     log_dir: Path | None = None,
     log: Optional[Callable[[str], None]] = None,
+    strict: bool = False,
+    output_format: str = "yaml",
+    jobs: int = 1,
 ):
     """Main entry point for the completer."""
     log = log or print
@@ -259,77 +658,84 @@ def main(
     log("📦 Using template structure (journals + proceedings)")
 
     # --- PASS 1: THE BRAIN ---
-    # Parse to understand the data
-    with open(input_path, "r", encoding="utf-8") as f:
-        parser = bibtexparser.bparser.BibTexParser(common_strings=True)
-        bib_db = bibtexparser.load(f, parser=parser)
+    # Scan to understand the data (single-pass field extractor; see
+    # _scan_bib_entries for why the full parser is skipped). --strict
+    # routes through bibtexparser for files the scanner may mis-read.
+    if strict:
+        entries = _parse_bib_entries_strict(input_path)
+    else:
+        entries = _scan_bib_entries(input_path)
 
     # Create a "Patch List": { "ENTRY_ID": { "field": "value", ... } }
     patches: Dict[str, Dict[str, str]] = {}
+    # Pre-encoded patch blocks keyed by bytes entry ID, formatted here in
+    # PASS 1 so the PASS 2 rewrite only has to write them. Entries sharing
+    # a template usually miss the same fields, so identical blocks are
+    # rendered once and reused via blob_cache.
+    patch_blobs: Dict[bytes, bytes] = {}
+    blob_cache: Dict[Tuple[Tuple[str, str], ...], bytes] = {}
     conflicts: Dict[str, List[Tuple[str, str, str]]] = {}
 
-    # Map normalized key -> (raw_venue, year, entry_type) for unique reporting
+    # Map normalized key -> (raw_venue, year, entry_type) for unique reporting.
+    # seen_missing mirrors the keys so the common repeat-venue case is one
+    # set probe instead of a setdefault (which hashes for the check and
+    # again for the insert).
     missing_templates: Dict[Tuple[str, str], Tuple[str, str, str]] = {}
+    seen_missing: set = set()
 
     # Collect field values from bib entries for pre-filling YAML templates.
-    # key -> { field_name -> Counter of values }
-    bib_field_counters: Dict[Tuple[str, str], Dict[str, Counter]] = {}
+    # key -> { field_name -> list of observed values }. Kept as plain lists
+    # during the scan; Counter runs once per field at YAML-emit time.
+    bib_field_values: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
 
     # Incomplete entries: missing year or venue (e.g., arxiv misc)
     # These are reported separately and do NOT contribute to the YAML file
     incomplete_entries: List[Tuple[str, str, str]] = []  # (entry_id, venue, year)
 
-    for entry in bib_db.entries:
-        entry_id = entry["ID"]
-        year = entry.get("year", "")
-        venue_raw = entry.get("booktitle") or entry.get("journal") or ""
-        entry_type = _detect_entry_type(entry)
+    # Per-entry work is independent, so large bibs can fan out across a
+    # process pool (--jobs); small ones stay serial to avoid fork overhead.
+    if jobs > 1 and len(entries) >= _PARALLEL_MIN_ENTRIES:
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            results = list(
+                ex.map(
+                    partial(_process_entry, collect=dry_run),
+                    entries,
+                    chunksize=256,
+                )
+            )
+    else:
+        results = [_process_entry(entry, collect=dry_run) for entry in entries]
 
-        if not year or not venue_raw:
-            # Incomplete entry - missing year or venue, likely arxiv/misc
-            incomplete_entries.append((entry_id, venue_raw, year))
+    for entry_id, fields_to_add, conflicts_to_add, missing, incomplete in results:
+        if incomplete is not None:
+            incomplete_entries.append((entry_id, *incomplete))
             continue
 
-        # Find matching template
-        clean_venue = normalize_text(venue_raw)
-        clean_year = normalize_text(year)
-
-        matched_template = find_template(venue_raw, year, entry_type)
-
-        if not matched_template:
-            # For journals, key is venue only (year-agnostic)
-            # For proceedings, key is (venue, year)
-            if entry_type == "journal":
-                key = (clean_venue, "")  # journals are year-agnostic
-            else:
-                key = (clean_venue, clean_year)
-            missing_templates.setdefault(key, (venue_raw, year, entry_type))
-
-            # Collect existing field values from this entry
-            collect_fields = (
-                _JOURNAL_COLLECT_FIELDS
-                if entry_type == "journal"
-                else _PROCEEDINGS_COLLECT_FIELDS
-            )
-            counters = bib_field_counters.setdefault(key, {})
-            for fname in collect_fields:
-                val = entry.get(fname, "").strip()
-                if val:
-                    counters.setdefault(fname, Counter())[val] += 1
+        if missing is not None:
+            key, venue_raw, year, entry_type, collected = missing
+            if key not in seen_missing:
+                seen_missing.add(key)
+                missing_templates[key] = (venue_raw, year, entry_type)
+            if collected:
+                values = bib_field_values.setdefault(key, {})
+                for fname, val in collected.items():
+                    values.setdefault(fname, []).append(val)
             continue
 
-        fields_to_add = {}
-        conflicts_to_add = []
-        for k, v in matched_template.items():
-            if k not in entry:
-                fields_to_add[k] = v
-            else:
-                existing_val = entry.get(k, "")
-                if normalize_text(existing_val) != normalize_text(v):
-                    conflicts_to_add.append((k, existing_val, v))
-
         if fields_to_add:
             patches[entry_id] = fields_to_add
+            sig = tuple(fields_to_add.items())
+            blob = blob_cache.get(sig)
+            if blob is None:
+                blob = "".join(
+                    f"  {key:<12} = {{{val}}},\n"
+                    for key, val in fields_to_add.items()
+                ).encode("utf-8")
+                blob_cache[sig] = blob
+            patch_blobs[entry_id.encode("utf-8")] = blob
         if conflicts_to_add:
             conflicts[entry_id] = conflicts_to_add
 
@@ -344,24 +750,6 @@ def main(
     missing_txt_log = output_dir / f"{base}.missing_templates.txt"
     missing_yaml_log = output_dir / f"{base}.missing_templates.yaml"
 
-    # Collect log rows
-    conflict_rows: List[str] = []
-    for eid, rows in conflicts.items():
-        for k, existing_val, tmpl_val in rows:
-            conflict_rows.append(
-                f"{eid}\t{k}\tEXISTING={existing_val}\tTEMPLATE={tmpl_val}"
-            )
-
-    missing_rows: List[str] = []
-    for venue_raw, year, entry_type in missing_templates.values():
-        missing_rows.append(f"{venue_raw}\t{year}\t{entry_type}")
-
-    incomplete_rows: List[str] = []
-    for entry_id, venue, year in incomplete_entries:
-        incomplete_rows.append(
-            f"{entry_id}\tvenue={venue or '(empty)'}\tyear={year or '(empty)'}"
-        )
-
     # Dry-run summary
     if dry_run:
         if patches:
@@ -405,70 +793,129 @@ def main(
         else:
             log("\n✅ All complete entries matched existing templates.")
 
-        # Write logs
-        write_report(
+        # Write logs (rows are generated lazily; write_report streams them
+        # straight into the buffered file handle). Empty reports create no
+        # file — the stdout summary above already says nothing was found.
+        incomplete_log = output_dir / f"{base}.incomplete_entries.txt"
+        written: List[Path] = []
+        if write_report(
             conflict_log,
             "conflicts: entry_id\tfield\texisting\ttemplate",
-            conflict_rows,
-        )
-        write_report(
+            (
+                f"{eid}\t{k}\tEXISTING={existing_val}\tTEMPLATE={tmpl_val}"
+                for eid, rows in conflicts.items()
+                for k, existing_val, tmpl_val in rows
+            ),
+            write_if_empty=False,
+        ):
+            written.append(conflict_log)
+        if write_report(
             missing_txt_log,
             "missing templates: venue\tyear\ttype",
-            missing_rows,
-        )
-
-        # Write incomplete entries log
-        incomplete_log = output_dir / f"{base}.incomplete_entries.txt"
-        write_report(
+            (
+                f"{venue_raw}\t{year}\t{entry_type}"
+                for venue_raw, year, entry_type in missing_templates.values()
+            ),
+            write_if_empty=False,
+        ):
+            written.append(missing_txt_log)
+        if write_report(
             incomplete_log,
             "incomplete entries (missing year or venue): entry_id\tvenue\tyear",
-            incomplete_rows,
-        )
+            (
+                f"{entry_id}\tvenue={venue or '(empty)'}\tyear={year or '(empty)'}"
+                for entry_id, venue, year in incomplete_entries
+            ),
+            write_if_empty=False,
+        ):
+            written.append(incomplete_log)
 
         # Write YAML file for missing templates (new workflow!)
         # Only include entries with both venue and year (not incomplete ones)
         if missing_templates:
-            # Flatten counters to most-common values
+            # Flatten collected values to most-common ones. Most fields only
+            # ever see one distinct value, so skip the most_common heap pass
+            # unless there is an actual tie to break.
             bib_collected: Dict[Tuple[str, str], Dict[str, str]] = {}
-            for tkey, field_counters in bib_field_counters.items():
+            for tkey, field_values in bib_field_values.items():
                 bib_collected[tkey] = {
-                    fname: counter.most_common(1)[0][0]
-                    for fname, counter in field_counters.items()
+                    fname: (
+                        vals[0]
+                        if len(set(vals)) == 1
+                        else Counter(vals).most_common(1)[0][0]
+                    )
+                    for fname, vals in field_values.items()
                 }
-            _write_yaml_missing_templates(
-                missing_yaml_log, missing_templates, bib_collected
-            )
-            log(f"\n📝 YAML template file created: {missing_yaml_log}")
-            log(
-                "   Fill in the fields and run: python yaml2templates.py {} --update".format(
-                    missing_yaml_log
+            if output_format == "py":
+                missing_py_log = output_dir / f"{base}.missing_templates.py"
+                _write_py_missing_templates(
+                    missing_py_log, missing_templates, bib_collected
+                )
+                log(f"\n📝 Python template file created: {missing_py_log}")
+                log("   Fill in the fields; import it or ast.literal_eval the list.")
+            else:
+                _write_yaml_missing_templates(
+                    missing_yaml_log, missing_templates, bib_collected
+                )
+                log(f"\n📝 YAML template file created: {missing_yaml_log}")
+                log(
+                    "   Fill in the fields and run: python yaml2templates.py {} --update".format(
+                        missing_yaml_log
+                    )
                 )
-            )
 
-        log(f"\nLogs saved: {conflict_log}, {missing_txt_log}, {incomplete_log}")
+        if written:
+            log(f"\nLogs saved: {', '.join(str(p) for p in written)}")
         return
 
     # --- PASS 2: THE SURGEON ---
-    # Read the file as plain text lines to preserve comments
-    with open(input_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        for line in lines:
-            f.write(line)
-
-            match = re.search(r"@\w+\s*\{\s*([^,]+),", line)
-
-            if match:
-                current_id = match.group(1).strip()
-
-                if current_id in patches:
-                    new_data = patches[current_id]
-
-                    for key, val in new_data.items():
-                        f.write(f"  {key:<12} = {{{val}}},\n")
-
-                    del patches[current_id]
+    # Rewrite the file by slicing an mmap around the patch points instead of
+    # looping over every line in Python. One finditer scan locates the entry
+    # headers; everything between patch points is copied as a single raw
+    # byte slice, so comments survive untouched and unpatched regions move
+    # at memcpy speed. Patch blocks were pre-encoded in PASS 1 (patch_blobs)
+    # so a patched entry costs a single extra write, and patch IDs stay as
+    # bytes so the scan never decodes. Output goes to a temp file that
+    # atomically replaces the destination at the end, so completing in
+    # place (--output equal to the input) can never truncate the file
+    # while it is being read.
+    out_path = Path(output_path)
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    try:
+        with open(input_path, "rb") as fi, open(
+            tmp_path, "wb", buffering=1 << 20
+        ) as fo:
+            size = Path(input_path).stat().st_size
+            if size:
+                mm = mmap.mmap(fi.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    prev = 0
+                    for match in _ENTRY_RE.finditer(mm):
+                        blob = patch_blobs.pop(match.group(1).strip(), None)
+                        if blob is None:
+                            continue
+                        # Inject right after the header line's newline
+                        eol = mm.find(b"\n", match.end())
+                        eol = size if eol < 0 else eol + 1
+                        fo.write(mm[prev:eol])
+                        fo.write(blob)
+                        prev = eol
+                    fo.write(mm[prev:])
+                finally:
+                    mm.close()
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, out_path)
+
+    # Every patch built in PASS 1 must find its header here; a leftover
+    # blob means the rewrite silently missed an entry, which must never
+    # pass without a trace
+    if patch_blobs:
+        missed = ", ".join(
+            sorted(key.decode("utf-8", "replace") for key in patch_blobs)
+        )
+        log(f"⚠️  PASS 2 could not locate {len(patch_blobs)} patched entries: {missed}")
 
     log(f"✅ Done! Saved to {output_path} (Comments preserved)")
 
@@ -497,6 +944,25 @@ def build_parser() -> argparse.ArgumentParser:
         help="After YAML generation, invoke yaml2templates to update templates.py "
         "and re-run completion. Requires that the YAML file has been filled in.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for PASS 1 on large files (default: 1, serial).",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=("yaml", "py"),
+        default="yaml",
+        help="Format for the missing-templates file (default: yaml). 'py' "
+        "writes an importable Python literal that skips the YAML parse.",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Parse the input with bibtexparser instead of the fast scanner "
+        "(slower; use for files with @string macros or exotic escaping).",
+    )
     return parser
 
 
@@ -512,6 +978,9 @@ def run(args: argparse.Namespace) -> None:
             dry_run=dry_run,
             log_dir=log_dir,
             log=logger.log,
+            strict=args.strict,
+            output_format=args.output_format,
+            jobs=args.jobs,
         )
 
         # If --update-templates is set, invoke yaml2templates on the generated YAML
@@ -543,6 +1012,7 @@ def run(args: argparse.Namespace) -> None:
                     import templates as _tpl_mod
 
                     importlib.reload(_tpl_mod)
+                    _rebuild_template_indexes(_tpl_mod)
 
                     main(
                         args.input,
@@ -550,6 +1020,7 @@ def run(args: argparse.Namespace) -> None:
                         dry_run=False,
                         log_dir=log_dir,
                         log=logger.log,
+                        strict=args.strict,
                     )
 
 
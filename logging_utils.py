@@ -26,8 +26,9 @@ from __future__ import annotations
 
 import sys
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import IO, List, Optional, TextIO
+from typing import IO, Iterable, Optional, TextIO
 
 # ---------------------------------------------------------------------------
 # Format constants — shared across all BibCC tools
@@ -46,13 +47,22 @@ SEPARATOR_THIN: str = "─"
 """Character for thin separators (summary lines)."""
 
 
+@cache
 def get_repo_dir() -> Path:
-    """Get the repository directory (where this file is located)."""
+    """Get the repository directory (where this file is located).
+
+    Cached: resolve() stats the path, and callers ask repeatedly.
+    """
     return Path(__file__).parent.resolve()
 
 
+@cache
 def get_logs_dir() -> Path:
-    """Get the logs directory (repo_dir/logs/)."""
+    """Get the logs directory (repo_dir/logs/).
+
+    Cached: the first call creates the directory, repeats skip both the
+    Path arithmetic and the mkdir stat.
+    """
     logs_dir = get_repo_dir() / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
     return logs_dir
@@ -63,7 +73,9 @@ def get_logs_dir() -> Path:
 # ---------------------------------------------------------------------------
 
 
-def write_report(path: Path, header: str, rows: List[str]) -> None:
+def write_report(
+    path: Path, header: str, rows: Iterable[str], write_if_empty: bool = True
+) -> bool:
     """Write a simple report file with *header* followed by *rows*.
 
     This is the canonical way to persist checker / completer output so that
@@ -74,12 +86,33 @@ def write_report(path: Path, header: str, rows: List[str]) -> None:
         <row 2>
         ...
 
-    If *rows* is empty the file will contain ``(none)`` as a placeholder.
+    *rows* may be any iterable (including a generator); rows are streamed
+    to the buffered file handle instead of being joined in memory first.
+    If *rows* yields nothing the file will contain ``(none)`` as a
+    placeholder — or, with ``write_if_empty=False``, no file is created
+    at all (saves filesystem churn in batch runs). Returns True if the
+    file was written.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    content = [header]
-    content.extend(rows if rows else ["(none)"])
-    path.write_text("\n".join(content) + "\n", encoding="utf-8")
+    f: Optional[IO[str]] = None
+    try:
+        for row in rows:
+            if f is None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                f = open(path, "w", encoding="utf-8")
+                f.write(header)
+                f.write("\n")
+            f.write(row)
+            f.write("\n")
+        if f is None:
+            if not write_if_empty:
+                return False
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(path, "w", encoding="utf-8")
+            f.write(f"{header}\n(none)\n")
+        return True
+    finally:
+        if f is not None:
+            f.close()
 
 
 class Logger:
@@ -116,13 +149,17 @@ class Logger:
         self._file: Optional[IO[str]] = None
         self._log_path: Optional[Path] = None
         self._buffer: list[str] = []
+        self._input_file = str(input_file) if input_file else None
+        self._opened = False
 
         if not enabled:
             return
 
-        # Always use logs/ subdirectory (unless explicit log_dir)
-        log_dir_path = Path(log_dir) if log_dir else get_logs_dir()
-        log_dir_path.mkdir(parents=True, exist_ok=True)
+        # Always use logs/ subdirectory (unless explicit log_dir).
+        # Only the path is computed here; directory and file creation are
+        # deferred to the first logged message so a Logger that never
+        # writes costs no I/O.
+        log_dir_path = Path(log_dir) if log_dir else get_repo_dir() / "logs"
 
         # Determine log file path
         if input_file:
@@ -133,17 +170,22 @@ class Logger:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self._log_path = log_dir_path / f"{tool_name}_{timestamp}{log_suffix}"
 
-        # Open log file
+    def _ensure_open(self) -> None:
+        """Open the log file and write its header on first use."""
+        if self._opened or self._log_path is None:
+            return
+        self._opened = True
         try:
+            self._log_path.parent.mkdir(parents=True, exist_ok=True)
             self._file = open(self._log_path, "w", encoding="utf-8")
             # Write header
             self._file.write(f"{SEPARATOR_HEAVY * SEPARATOR_WIDTH}\n")
-            self._file.write(f"{tool_name.upper()} LOG\n")
+            self._file.write(f"{self.tool_name.upper()} LOG\n")
             self._file.write(
                 f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
             )
-            if input_file:
-                self._file.write(f"Input: {input_file}\n")
+            if self._input_file:
+                self._file.write(f"Input: {self._input_file}\n")
             self._file.write(f"{SEPARATOR_HEAVY * SEPARATOR_WIDTH}\n\n")
         except IOError as e:
             print(f"⚠️  Could not create log file {self._log_path}: {e}")
@@ -175,11 +217,14 @@ class Logger:
         if to_stdout:
             print(full_message)
 
+        if to_file and self.enabled:
+            self._ensure_open()
         if to_file and self._file and self.enabled:
             # Strip ANSI codes and some emojis for cleaner log files
             clean_message = full_message
+            # No per-message flush: the buffered handle batches writes and
+            # close() flushes everything on exit
             self._file.write(clean_message + "\n")
-            self._file.flush()
 
     def log_separator(
         self, char: str = SEPARATOR_LIGHT, length: int = SEPARATOR_WIDTH
@@ -210,7 +255,7 @@ class Logger:
             self._file.close()
             self._file = None
 
-        if self._log_path and self.enabled:
+        if self._log_path and self.enabled and self._opened:
             print(f"\n📝 Log saved to: {self._log_path}")
 
     def __enter__(self) -> "Logger":
@@ -231,9 +276,10 @@ class TeeWriter:
         self.writers = writers
 
     def write(self, text: str) -> int:
+        # Writes are left buffered; line-buffered callers (e.g. print to a
+        # tty) call flush() themselves when they need visibility
         for writer in self.writers:
             writer.write(text)
-            writer.flush()
         return len(text)
 
     def flush(self) -> None:
@@ -724,3 +724,67 @@ PROCEEDINGS_TEMPLATES = {
     },
 
 }
+
+
+# Intern every key and value string once at import. Field names and many
+# values (publishers, addresses, series names) repeat across templates;
+# interning collapses the duplicates to shared objects so downstream dict
+# probes compare by identity after the hash.
+
+import sys
+
+
+def _intern_templates(table):
+    out = {}
+    for key, fields in table.items():
+        if isinstance(key, tuple):
+            key = tuple(sys.intern(part) for part in key)
+        else:
+            key = sys.intern(key)
+        out[key] = {
+            sys.intern(name): sys.intern(value) for name, value in fields.items()
+        }
+    return out
+
+
+JOURNAL_TEMPLATES = _intern_templates(JOURNAL_TEMPLATES)
+PROCEEDINGS_TEMPLATES = _intern_templates(PROCEEDINGS_TEMPLATES)
+
+
+# Pre-normalized lookup tables, derived once at import time.
+# The tables above keep their display-form keys (yaml2templates.py
+# regenerates this file and the checkers print them verbatim); lookup
+# consumers such as completer.find_template want brace-stripped lowercase
+# keys, so those are derived here instead of being re-normalized per call.
+
+def _normalize_key(text: str) -> str:
+    return text.replace("{", "").replace("}", "").strip().lower()
+
+
+NORMALIZED_JOURNAL_TEMPLATES = {}
+for _name, _fields in JOURNAL_TEMPLATES.items():
+    _norm = _normalize_key(_name)
+    NORMALIZED_JOURNAL_TEMPLATES[_norm] = _fields
+    # Alias LaTeX-escaped names under their plain form ("\\&" -> "&") so
+    # entries written without the escape still match the same record
+    _plain = _norm.replace("\\&", "&")
+    if _plain != _norm:
+        NORMALIZED_JOURNAL_TEMPLATES.setdefault(_plain, _fields)
+
+NORMALIZED_PROCEEDINGS_TEMPLATES = {}
+for (_venue, _year), _fields in PROCEEDINGS_TEMPLATES.items():
+    _norm = _normalize_key(_venue)
+    _norm_year = _normalize_key(_year)
+    NORMALIZED_PROCEEDINGS_TEMPLATES[(_norm, _norm_year)] = _fields
+    _plain = _norm.replace("\\&", "&")
+    if _plain != _norm:
+        NORMALIZED_PROCEEDINGS_TEMPLATES.setdefault((_plain, _norm_year), _fields)
+
+# Expose the tables read-only: every consumer either just reads them or
+# (yaml2templates) copies before merging, and a frozen view prevents a
+# stray mutation from desyncing the derived NORMALIZED_* tables below.
+
+from types import MappingProxyType
+
+JOURNAL_TEMPLATES = MappingProxyType(JOURNAL_TEMPLATES)
+PROCEEDINGS_TEMPLATES = MappingProxyType(PROCEEDINGS_TEMPLATES)
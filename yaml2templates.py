@@ -35,8 +35,10 @@ def load_templates_module(
     mod = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(mod)
 
-    journal_templates = getattr(mod, "JOURNAL_TEMPLATES", {})
-    proceedings_templates = getattr(mod, "PROCEEDINGS_TEMPLATES", {})
+    # Copy: templates.py exposes read-only views, and the update flow
+    # merges user edits into these before regenerating the file
+    journal_templates = dict(getattr(mod, "JOURNAL_TEMPLATES", {}))
+    proceedings_templates = dict(getattr(mod, "PROCEEDINGS_TEMPLATES", {}))
 
     return journal_templates, proceedings_templates
 
@@ -59,6 +61,50 @@ def _year_value(year_str: str) -> int:
         return -1
 
 
+def _issn_valid(value: str) -> bool:
+    """Check an ISSN's check digit (ISO 3297, mod-11)."""
+    digits = value.replace("-", "").strip().upper()
+    if len(digits) != 8 or not digits[:7].isdigit():
+        return False
+    if not (digits[7].isdigit() or digits[7] == "X"):
+        return False
+    total = sum(int(d) * w for d, w in zip(digits[:7], range(8, 1, -1)))
+    check = (11 - total % 11) % 11
+    return digits[7] == ("X" if check == 10 else str(check))
+
+
+def _isbn_valid(value: str) -> bool:
+    """Check an ISBN's check digit (ISBN-13 mod-10, or legacy ISBN-10 mod-11)."""
+    digits = value.replace("-", "").replace(" ", "").strip().upper()
+    if len(digits) == 13 and digits.isdigit():
+        total = sum(int(d) * (1 if i % 2 == 0 else 3) for i, d in enumerate(digits))
+        return total % 10 == 0
+    if (
+        len(digits) == 10
+        and digits[:9].isdigit()
+        and (digits[9].isdigit() or digits[9] == "X")
+    ):
+        total = sum(int(d) * (10 - i) for i, d in enumerate(digits[:9]))
+        total += 10 if digits[9] == "X" else int(digits[9])
+        return total % 11 == 0
+    return False
+
+
+def _warn_bad_checksums(venue: str, year: str, fields: Dict[str, Any]) -> None:
+    """Warn about issn/isbn values whose check digit does not verify.
+
+    Validation happens once here, when new data enters the templates —
+    the formatter itself never re-validates static template fields.
+    The entry is still merged: the warning flags a likely typo in the
+    filled-in YAML without blocking the update.
+    """
+    label = f"({venue}, {year})" if year else venue
+    for name, checker in (("issn", _issn_valid), ("isbn", _isbn_valid)):
+        value = fields.get(name)
+        if value and not checker(str(value)):
+            print(f"⚠️  {name.upper()} checksum looks wrong for {label}: {value}")
+
+
 def load_yaml_templates(yaml_path: Path) -> List[Dict[str, Any]]:
     """Load template entries from YAML file."""
     with open(yaml_path, "r", encoding="utf-8") as f:
@@ -135,6 +181,76 @@ Templates are separated into two categories:
 This eliminates redundancy where the same journal was repeated for each year with identical fields.
 """
 
+'''
+
+    # Derived lookup tables that templates.py builds at import time;
+    # regenerated files must keep this footer so completer.find_template
+    # keeps its O(1) pre-normalized lookups.
+    footer = '''
+
+# Intern every key and value string once at import. Field names and many
+# values (publishers, addresses, series names) repeat across templates;
+# interning collapses the duplicates to shared objects so downstream dict
+# probes compare by identity after the hash.
+
+import sys
+
+
+def _intern_templates(table):
+    out = {}
+    for key, fields in table.items():
+        if isinstance(key, tuple):
+            key = tuple(sys.intern(part) for part in key)
+        else:
+            key = sys.intern(key)
+        out[key] = {
+            sys.intern(name): sys.intern(value) for name, value in fields.items()
+        }
+    return out
+
+
+JOURNAL_TEMPLATES = _intern_templates(JOURNAL_TEMPLATES)
+PROCEEDINGS_TEMPLATES = _intern_templates(PROCEEDINGS_TEMPLATES)
+
+
+# Pre-normalized lookup tables, derived once at import time.
+# The tables above keep their display-form keys (yaml2templates.py
+# regenerates this file and the checkers print them verbatim); lookup
+# consumers such as completer.find_template want brace-stripped lowercase
+# keys, so those are derived here instead of being re-normalized per call.
+
+def _normalize_key(text: str) -> str:
+    return text.replace("{", "").replace("}", "").strip().lower()
+
+
+NORMALIZED_JOURNAL_TEMPLATES = {}
+for _name, _fields in JOURNAL_TEMPLATES.items():
+    _norm = _normalize_key(_name)
+    NORMALIZED_JOURNAL_TEMPLATES[_norm] = _fields
+    # Alias LaTeX-escaped names under their plain form ("\\&" -> "&") so
+    # entries written without the escape still match the same record
+    _plain = _norm.replace("\\&", "&")
+    if _plain != _norm:
+        NORMALIZED_JOURNAL_TEMPLATES.setdefault(_plain, _fields)
+
+NORMALIZED_PROCEEDINGS_TEMPLATES = {}
+for (_venue, _year), _fields in PROCEEDINGS_TEMPLATES.items():
+    _norm = _normalize_key(_venue)
+    _norm_year = _normalize_key(_year)
+    NORMALIZED_PROCEEDINGS_TEMPLATES[(_norm, _norm_year)] = _fields
+    _plain = _norm.replace("\\&", "&")
+    if _plain != _norm:
+        NORMALIZED_PROCEEDINGS_TEMPLATES.setdefault((_plain, _norm_year), _fields)
+''' + '''
+
+# Expose the tables read-only: every consumer either just reads them or
+# (yaml2templates) copies before merging, and a frozen view prevents a
+# stray mutation from desyncing the derived NORMALIZED_* tables above.
+
+from types import MappingProxyType
+
+JOURNAL_TEMPLATES = MappingProxyType(JOURNAL_TEMPLATES)
+PROCEEDINGS_TEMPLATES = MappingProxyType(PROCEEDINGS_TEMPLATES)
 '''
 
     content = (
@@ -146,7 +262,7 @@ This eliminates redundancy where the same journal was repeated for each year wit
         + "# Proceedings templates are keyed by (venue_name, year) tuple\n"
         + "# These fields vary by year: venue location, isbn, editor, month, etc.\n"
         + render_proceedings_templates(proceedings_templates)
-        + "\n"
+        + footer
     )
 
     path.write_text(content, encoding="utf-8")
@@ -197,6 +313,8 @@ def yaml2templates(
         # Remove empty fields
         fields = {k: v for k, v in fields.items() if v and str(v).strip()}
 
+        _warn_bad_checksums(venue, year, fields)
+
         if entry_type == "journal":
             # Journal: keyed by name only
             norm_venue = normalize_text(venue)